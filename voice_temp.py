@@ -1,23 +1,28 @@
+import io
 import os
 import csv
+import argparse
 import time
+import sched
+import atexit
+import hashlib
+import queue
 import logging
-import tempfile
-from pathlib import Path
-from datetime import datetime
+import threading
+from datetime import datetime, timedelta
 from dataclasses import dataclass
-from typing import Optional, Tuple
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Tuple
 
-import schedule
 import sounddevice as sd
 import numpy as np
-import soundfile as sf
-from twilio.rest import Client
 from dotenv import load_dotenv
-import openai
-import dateparser
-from pydub import AudioSegment
-from pydub.playback import play
+
+# openai, twilio, dateparser and faster-whisper are imported where first used
+if TYPE_CHECKING:
+    from faster_whisper import WhisperModel
+    from twilio.rest import Client
 
 # Configure logging
 logging.basicConfig(
@@ -26,15 +31,63 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# OpenAI TTS "pcm" responses are 24 kHz mono signed 16-bit little-endian
+TTS_SAMPLE_RATE = 24000
+
+WELCOME_PROMPT = "Welcome to your voice-activated task scheduler. Say 'schedule a task' to begin, or 'exit' to quit."
+COMMAND_PROMPT = "What would you like to do?"
+TASK_NAME_PROMPT = "Please say the task name:"
+DUE_DATE_PROMPT = "When is this due? For example, you can say 'tomorrow at 3pm'"
+RETRY_PROMPT = "Sorry, I didn't catch that. Please try again."
+UNKNOWN_COMMAND_PROMPT = "I didn't understand that command. Please try again."
+GOODBYE_PROMPT = "Exiting the task scheduler. Goodbye!"
+INTERRUPTED_PROMPT = "Interrupted by user. Exiting the task scheduler."
+
+# Fixed prompts shipped as pre-generated audio (see generate_prompt_assets)
+FIXED_PROMPTS = (
+    WELCOME_PROMPT,
+    COMMAND_PROMPT,
+    TASK_NAME_PROMPT,
+    DUE_DATE_PROMPT,
+    RETRY_PROMPT,
+    UNKNOWN_COMMAND_PROMPT,
+    GOODBYE_PROMPT,
+    INTERRUPTED_PROMPT,
+)
+
+def prompt_key(text: str) -> str:
+    """Return the file name stem used to store audio for a prompt"""
+    return hashlib.sha1(text.encode('utf-8')).hexdigest()
+
 @dataclass
 class TaskConfig:
     """Configuration for task management"""
     csv_file: str = 'tasks.csv'
     sample_rate: int = 16000
     channels: int = 1
-    record_duration: int = 3
+    block_size: int = 1600
+    chunk_duration: float = 1.0
+    end_silence_ms: int = 400
+    no_speech_timeout: int = 5
+    max_utterance_duration: int = 15
+    ring_buffer_duration: int = 30
     max_retries: int = 3
-    temp_dir: str = os.path.join(os.path.expanduser('~'), 'voice_scheduler_temp')
+    whisper_model: str = 'small'
+    asr_batch_size: int = 8
+    # 0 batches only requests already queued; raise it when serving several sessions
+    asr_batch_wait_ms: int = 0
+    tts_cache_dir: str = os.path.join(os.path.expanduser('~'), 'voice_scheduler_cache', 'tts')
+    prompt_assets_dir: str = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'assets', 'prompts')
+    
+    def __post_init__(self):
+        # The capture ring must hold a whole utterance so a consumer stalled in
+        # transcription can catch up before unread samples are overwritten
+        if self.ring_buffer_duration <= max(self.max_utterance_duration, self.chunk_duration):
+            raise ValueError(
+                f"ring_buffer_duration ({self.ring_buffer_duration}s) must exceed both "
+                f"max_utterance_duration ({self.max_utterance_duration}s) and "
+                f"chunk_duration ({self.chunk_duration}s)"
+            )
 
 @dataclass
 class Task:
@@ -45,85 +98,356 @@ class Task:
 
 class AudioManager:
     """Handles audio recording and playback operations"""
+    SPEECH_CACHE_SIZE = 64
+    INPUT_STALL_TIMEOUT = 3.0
+    
     def __init__(self, config: TaskConfig):
         self.config = config
-        self._ensure_temp_dir()
+        self._ensure_cache_dir()
+        self._tts_pool = ThreadPoolExecutor(max_workers=2)
+        self._pending_speech: Dict[str, Future] = {}
+        self._pending_lock = threading.Lock()
+        self._speech_cache: "OrderedDict[str, Tuple[np.ndarray, int]]" = OrderedDict()
+        self._speech_cache_lock = threading.Lock()
+        self._prompts = self._load_prompt_assets()
+        self._beep = self._make_beep()
+        self._last_prompt: Optional[str] = None
+        
+        # Keep one input and one output stream open for the process lifetime.
+        # The input callback writes into a preallocated ring buffer that
+        # stream_audio reads from; the output callback drains the current
+        # playback buffer, so neither direction blocks the calling thread.
+        self._ring = np.zeros(
+            self.config.sample_rate * self.config.ring_buffer_duration, dtype=np.float32
+        )
+        self._written = 0
+        self._input_ready = threading.Event()
+        # [pcm, position] of the prompt being played, or None when idle
+        self._playback: Optional[List] = None
+        self._playback_finished = threading.Condition()
+        self._in = sd.InputStream(
+            samplerate=self.config.sample_rate,
+            channels=self.config.channels,
+            dtype='float32',
+            blocksize=self.config.block_size,
+            callback=self._on_input
+        )
+        self._out = sd.OutputStream(
+            samplerate=TTS_SAMPLE_RATE,
+            channels=1,
+            dtype='int16',
+            callback=self._on_output
+        )
+        self._in.start()
+        self._out.start()
+        atexit.register(self.close)
     
-    def _ensure_temp_dir(self):
-        """Ensure temporary directory exists with proper permissions"""
-        os.makedirs(self.config.temp_dir, exist_ok=True)
+    def close(self) -> None:
+        """Stop the audio streams and background synthesis"""
+        self.wait_for_playback(timeout=10)
+        for stream in (self._in, self._out):
+            try:
+                stream.stop()
+                stream.close()
+            except Exception as e:
+                logger.warning(f"Failed to close audio stream: {e}")
+        self._tts_pool.shutdown(wait=False)
+    
+    def _load_prompt_assets(self) -> Dict[str, np.ndarray]:
+        """Memory-map the pre-generated audio for fixed prompts that are present"""
+        prompts = {}
+        for text in FIXED_PROMPTS:
+            path = os.path.join(self.config.prompt_assets_dir, f"{prompt_key(text)}.npy")
+            if os.path.exists(path):
+                prompts[text] = np.load(path, mmap_mode='r')
+        return prompts
+    
+    @staticmethod
+    def _make_beep(frequency: float = 880.0, duration: float = 0.2) -> np.ndarray:
+        """Generate a short sine tone with faded edges as 16-bit PCM"""
+        t = np.arange(int(TTS_SAMPLE_RATE * duration)) / TTS_SAMPLE_RATE
+        tone = np.sin(2 * np.pi * frequency * t)
+        fade = np.minimum(1.0, np.minimum(t, duration - t) / 0.01)
+        return (tone * fade * 0.3 * 32767).astype(np.int16)
+    
+    def _ensure_cache_dir(self):
+        """Ensure the TTS cache directory exists with proper permissions"""
+        os.makedirs(self.config.tts_cache_dir, exist_ok=True)
+        
+    @staticmethod
+    def _request_speech(text: str) -> np.ndarray:
+        """Synthesize text with OpenAI TTS as raw 16-bit PCM"""
+        import openai
         
-    def _get_temp_path(self, suffix: str) -> str:
-        """Generate a temporary file path"""
-        return os.path.join(
-            self.config.temp_dir,
-            f"temp_{int(time.time())}_{os.getpid()}{suffix}"
+        response = openai.audio.speech.create(
+            model="tts-1",
+            voice="alloy",
+            input=text,
+            response_format="pcm"
         )
+        return np.frombuffer(response.read(), dtype=np.int16)
+    
+    def _synthesize(self, text: str) -> Tuple[np.ndarray, int]:
+        """Return decoded speech for text from an in-memory LRU, synthesizing on a miss"""
+        with self._speech_cache_lock:
+            speech = self._speech_cache.get(text)
+            if speech is not None:
+                self._speech_cache.move_to_end(text)
+                return speech
+        
+        if text in FIXED_PROMPTS:
+            speech = self._load_fixed_prompt(text)
+        else:
+            speech = self._request_speech(text), TTS_SAMPLE_RATE
+        
+        with self._speech_cache_lock:
+            self._speech_cache[text] = speech
+            self._speech_cache.move_to_end(text)
+            if len(self._speech_cache) > self.SPEECH_CACHE_SIZE:
+                self._speech_cache.popitem(last=False)
+        return speech
+    
+    def _load_fixed_prompt(self, text: str) -> Tuple[np.ndarray, int]:
+        """Return speech for a fixed prompt, persisting it in the on-disk cache
+        
+        Only fixed prompts are written to disk so task names and error text
+        never leave memory and the cache stays bounded.
+        """
+        # Entries are headerless 24 kHz s16le, loaded with a single read into int16
+        cache_path = os.path.join(self.config.tts_cache_dir, f"{prompt_key(text)}.pcm")
         
+        if os.path.exists(cache_path):
+            return np.fromfile(cache_path, dtype=np.int16), TTS_SAMPLE_RATE
+        
+        pcm = self._request_speech(text)
+        try:
+            partial_path = f"{cache_path}.{os.getpid()}.tmp"
+            pcm.tofile(partial_path)
+            os.replace(partial_path, cache_path)
+        except OSError as e:
+            logger.warning(f"Failed to cache speech for '{text}': {e}")
+        return pcm, TTS_SAMPLE_RATE
+    
+    def prefetch_speech(self, text: str) -> Future:
+        """Start synthesizing text in the background, reusing any in-flight request"""
+        if text in self._prompts:
+            future: Future = Future()
+            future.set_result((self._prompts[text], TTS_SAMPLE_RATE))
+            return future
+        
+        with self._pending_lock:
+            future = self._pending_speech.get(text)
+            if future is None:
+                future = self._tts_pool.submit(self._synthesize, text)
+                self._pending_speech[text] = future
+                future.add_done_callback(lambda _: self._pending_speech.pop(text, None))
+        return future
+    
     def text_to_speech(self, text: str) -> None:
-        """Convert text to speech using OpenAI TTS"""
-        temp_mp3 = self._get_temp_path(".mp3")
-        temp_wav = self._get_temp_path(".wav")
+        """Start speaking text using OpenAI TTS, beeping if text was just spoken
         
+        Returns once playback has started; use wait_for_playback to block
+        until it ends. Earlier playback is allowed to finish first.
+        """
         try:
-            # Get the speech response from OpenAI
-            response = openai.audio.speech.create(
-                model="tts-1",
-                voice="alloy",
-                input=text
-            )
-            
-            # Save the response content to MP3 file
-            with open(temp_mp3, 'wb') as f:
-                for chunk in response.iter_bytes():
-                    f.write(chunk)
-            
-            # Convert to WAV and play
-            audio = AudioSegment.from_mp3(temp_mp3)
-            audio.export(temp_wav, format='wav')
-            
-            # Play using sounddevice
-            wav_data, samplerate = sf.read(temp_wav)
-            sd.play(wav_data, samplerate)
-            sd.wait()
-            
+            if text == self._last_prompt:
+                pcm = self._beep
+            else:
+                pcm, _ = self.prefetch_speech(text).result()
+            self._last_prompt = text
+            self.wait_for_playback()
+            # One assignment starts playback, so an interrupt can't leave it half set up
+            self._playback = [pcm, 0]
         except Exception as e:
             logger.error(f"Error in text_to_speech: {e}")
             raise
-        finally:
-            # Clean up temporary files
-            for temp_file in [temp_mp3, temp_wav]:
-                try:
-                    if os.path.exists(temp_file):
-                        os.remove(temp_file)
-                except Exception as e:
-                    logger.warning(f"Failed to remove temporary file {temp_file}: {e}")
     
-    def record_audio(self) -> np.ndarray:
-        """Record audio from microphone"""
+    def wait_for_playback(self, timeout: Optional[float] = None) -> bool:
+        """Block until queued speech has been handed to the output device"""
+        with self._playback_finished:
+            return self._playback_finished.wait_for(lambda: self._playback is None, timeout)
+    
+    def _on_output(self, outdata, frames, time_info, status) -> None:
+        """Output stream callback feeding the current playback buffer"""
+        if status:
+            logger.warning(f"Output stream status: {status}")
+        playback, count = self._playback, 0
+        if playback is not None:
+            pcm, position = playback
+            count = min(frames, len(pcm) - position)
+            outdata[:count, 0] = pcm[position:position + count]
+            playback[1] = position + count
+            if playback[1] >= len(pcm):
+                with self._playback_finished:
+                    self._playback = None
+                    self._playback_finished.notify_all()
+        outdata[count:] = 0
+    
+    def _on_input(self, indata, frames, time_info, status) -> None:
+        """Input stream callback copying captured samples into the ring buffer"""
+        if status:
+            logger.warning(f"Input stream status: {status}")
+        ring_size = len(self._ring)
+        start = self._written % ring_size
+        end = start + frames
+        if end <= ring_size:
+            self._ring[start:end] = indata[:, 0]
+        else:
+            split = ring_size - start
+            self._ring[start:] = indata[:split, 0]
+            self._ring[:end - ring_size] = indata[split:, 0]
+        self._written += frames
+        self._input_ready.set()
+    
+    def _read_ring(self, start: int, end: int) -> np.ndarray:
+        """Return samples [start, end) of the capture, as a view unless they wrap"""
+        ring_size = len(self._ring)
+        first, last = start % ring_size, end % ring_size
+        if first < last:
+            return self._ring[first:last]
+        return np.concatenate((self._ring[first:], self._ring[:last]))
+    
+    def stream_audio(self) -> Iterator[np.ndarray]:
+        """Yield microphone audio until the generator is closed
+        
+        Each chunk holds everything captured since the previous one, and at
+        least chunk_duration of it, so a slow consumer catches up in one step
+        instead of working through a backlog. Chunks may be views into the
+        ring buffer and are only valid until it wraps around, so consumers
+        must copy anything they keep longer.
+        """
+        chunk_size = int(self.config.chunk_duration * self.config.sample_rate)
         try:
-            logger.info(f"Recording for {self.config.record_duration} seconds...")
-            audio = sd.rec(
-                int(self.config.record_duration * self.config.sample_rate),
-                samplerate=self.config.sample_rate,
-                channels=self.config.channels,
-                dtype='int16'
-            )
-            sd.wait()
-            return audio
+            # Start after the prompt has finished playing so it isn't captured
+            self.wait_for_playback()
+            time.sleep(self._out.latency)
+            position = self._written
+            logger.info("Listening...")
+            while True:
+                last_input = time.monotonic()
+                while True:
+                    self._input_ready.clear()
+                    if self._written - position >= chunk_size:
+                        break
+                    if self._input_ready.wait(timeout=1.0):
+                        last_input = time.monotonic()
+                    elif not self._in.active or time.monotonic() - last_input > self.INPUT_STALL_TIMEOUT:
+                        raise RuntimeError("No audio received from the input device")
+                
+                written = self._written
+                if written - position > len(self._ring):
+                    logger.warning("Audio capture overran the ring buffer; skipping ahead")
+                    position = written - chunk_size
+                yield self._read_ring(position, written)
+                position = written
         except Exception as e:
             logger.error(f"Error recording audio: {e}")
             raise
+
+class TranscriptionBatcher:
+    """Batches concurrent transcription requests into shared Whisper forward passes"""
+    # Requests are grouped by utterance length (seconds) so a batch decodes
+    # transcripts of similar length and short utterances aren't held back
+    BUCKET_LIMITS = (5, 15, 30)
+    # Same thresholds as faster-whisper: a result is only treated as silence
+    # when the model both flags no speech and is unsure of what it decoded
+    NO_SPEECH_THRESHOLD = 0.6
+    LOG_PROB_THRESHOLD = -1.0
+    BEAM_SIZE = 5
+    
+    def __init__(self, model: "WhisperModel", max_batch: int, max_wait_ms: int):
+        from faster_whisper.tokenizer import Tokenizer
+        from faster_whisper.transcribe import get_suppressed_tokens
+        
+        self.model = model
+        self.max_batch = max_batch
+        self.max_wait = max_wait_ms / 1000
+        self._tokenizer = Tokenizer(
+            model.hf_tokenizer,
+            model.model.is_multilingual,
+            task="transcribe",
+            language="en"
+        )
+        self._prompt = model.get_prompt(self._tokenizer, [], without_timestamps=True)
+        self._suppress_tokens = get_suppressed_tokens(self._tokenizer, [-1])
+        self._requests: "queue.Queue[Tuple[np.ndarray, Future]]" = queue.Queue()
+        self._worker = threading.Thread(target=self._run, name="asr-batcher", daemon=True)
+        self._worker.start()
+    
+    def submit(self, audio: np.ndarray) -> Future:
+        """Queue 16 kHz float32 audio for transcription"""
+        future: Future = Future()
+        self._requests.put((audio, future))
+        return future
+    
+    def _run(self) -> None:
+        """Drain the request queue into batches of up to max_batch
+        
+        With max_wait of zero only requests that are already queued join the
+        batch, so a lone caller never waits for company.
+        """
+        while True:
+            batch = [self._requests.get()]
+            deadline = time.monotonic() + self.max_wait
+            while len(batch) < self.max_batch:
+                timeout = deadline - time.monotonic()
+                try:
+                    if timeout <= 0:
+                        batch.append(self._requests.get_nowait())
+                    else:
+                        batch.append(self._requests.get(timeout=timeout))
+                except queue.Empty:
+                    break
+            
+            for bucket in self._bucket(batch):
+                self._transcribe(bucket)
+    
+    def _bucket(self, batch: List[Tuple[np.ndarray, Future]]) -> List[List[Tuple[np.ndarray, Future]]]:
+        """Split a batch into groups of similar utterance length"""
+        sample_rate = self.model.feature_extractor.sampling_rate
+        buckets: Dict[int, List[Tuple[np.ndarray, Future]]] = {}
+        for request in batch:
+            seconds = len(request[0]) / sample_rate
+            limit = next((l for l in self.BUCKET_LIMITS if seconds <= l), self.BUCKET_LIMITS[-1])
+            buckets.setdefault(limit, []).append(request)
+        return list(buckets.values())
     
-    def save_audio(self, audio: np.ndarray) -> str:
-        """Save audio to temporary file"""
-        temp_path = self._get_temp_path(".wav")
+    def _transcribe(self, requests: List[Tuple[np.ndarray, Future]]) -> None:
+        """Run one encoder/decoder pass over a bucket and resolve its futures"""
+        from faster_whisper.audio import pad_or_trim
+        
         try:
-            sf.write(temp_path, audio, self.config.sample_rate)
-            return temp_path
+            # The encoder takes fixed 30 s windows, so pad_or_trim does the padding
+            features = np.stack([
+                pad_or_trim(self.model.feature_extractor(audio)[..., :-1])
+                for audio, _ in requests
+            ])
+            encoder_output = self.model.encode(features)
+            results = self.model.model.generate(
+                encoder_output,
+                [self._prompt] * len(requests),
+                beam_size=self.BEAM_SIZE,
+                max_length=self.model.max_length,
+                suppress_blank=True,
+                suppress_tokens=self._suppress_tokens,
+                return_scores=True,
+                return_no_speech_prob=True
+            )
+            for (_, future), result in zip(requests, results):
+                tokens = result.sequences_ids[0]
+                # scores[0] is length-normalized (length_penalty=1); undo it as faster-whisper does
+                avg_logprob = result.scores[0] * len(tokens) / (len(tokens) + 1)
+                if (
+                    result.no_speech_prob > self.NO_SPEECH_THRESHOLD
+                    and avg_logprob < self.LOG_PROB_THRESHOLD
+                ):
+                    future.set_result("")
+                else:
+                    future.set_result(self._tokenizer.decode(tokens).strip())
         except Exception as e:
-            logger.error(f"Error saving audio: {e}")
-            raise
+            for _, future in requests:
+                if not future.done():
+                    future.set_exception(e)
 
 class TaskManager:
     """Manages task operations including creation and storage"""
@@ -132,17 +456,75 @@ class TaskManager:
         self.audio_manager = audio_manager
         self._initialize_csv()
         
+        # Single unbuffered append handle; each row is one write() call
+        self._csv_file = open(self.config.csv_file, 'ab', buffering=0)
+        self._csv_row = io.StringIO()
+        self._csv_writer = csv.writer(self._csv_row)
+        self._pool = ThreadPoolExecutor(max_workers=4)
+        
+        # Reminders live in a heap; the thread sleeps until the earliest one is due
+        self._reminder_wakeup = threading.Event()
+        self._reminders = sched.scheduler(time.time, self._wait_for_reminder)
+        self._reminder_thread = threading.Thread(
+            target=self._run_reminders, name="reminders", daemon=True
+        )
+        self._reminder_thread.start()
+        
         # Load environment variables
         load_dotenv()
         
-        # Initialize APIs
-        openai.api_key = os.getenv("OPENAI_API_KEY")
-        self.twilio_client = Client(
-            os.getenv("TWILIO_ACCOUNT_SID"),
-            os.getenv("TWILIO_AUTH_TOKEN")
-        )
+        # API clients are created on first use; openai reads OPENAI_API_KEY itself
+        self._twilio_client: Optional["Client"] = None
+        self._twilio_lock = threading.Lock()
         self.twilio_whatsapp_number = os.getenv("TWILIO_WHATSAPP_NUMBER")
         self.user_whatsapp_number = os.getenv("USER_WHATSAPP_NUMBER")
+        
+        self._date_parser = None
+        
+        # Load and warm Whisper in the background so it overlaps the welcome prompt
+        self._asr: Optional[TranscriptionBatcher] = None
+        self._asr_ready = self._pool.submit(self._load_asr)
+    
+    def _load_asr(self) -> None:
+        """Load the local Whisper model and VAD, then warm them up"""
+        import ctranslate2
+        from faster_whisper import WhisperModel
+        from faster_whisper.vad import VadOptions
+        
+        # Load local Whisper model with int8 weights; on CUDA accumulate in fp16
+        if ctranslate2.get_cuda_device_count() > 0:
+            device, compute_type = "cuda", "int8_float16"
+        else:
+            device, compute_type = "cpu", "int8"
+        self._whisper = WhisperModel(
+            self.config.whisper_model,
+            device=device,
+            compute_type=compute_type
+        )
+        self._asr = TranscriptionBatcher(
+            self._whisper,
+            max_batch=self.config.asr_batch_size,
+            max_wait_ms=self.config.asr_batch_wait_ms
+        )
+        self._vad_options = VadOptions(
+            min_silence_duration_ms=self.config.end_silence_ms,
+            speech_pad_ms=30
+        )
+        
+        # Run a silent clip through the model and VAD so the first utterance
+        # doesn't pay for kernel selection and lazy CUDA initialization
+        try:
+            from faster_whisper.vad import get_speech_timestamps
+            
+            silence = np.zeros(self.config.sample_rate, dtype=np.float32)
+            get_speech_timestamps(silence, vad_options=self._vad_options)
+            self._asr.submit(silence).result()
+        except Exception as e:
+            logger.warning(f"ASR warm-up failed: {e}")
+    
+    def wait_for_asr(self) -> None:
+        """Block until the Whisper model is loaded, re-raising any load error"""
+        self._asr_ready.result()
     
     def _initialize_csv(self) -> None:
         """Initialize CSV file if it doesn't exist"""
@@ -151,52 +533,132 @@ class TaskManager:
                 writer = csv.writer(f)
                 writer.writerow(['Task Name', 'Due Date', 'Deadline Time'])
     
-    def speech_to_text(self, audio_path: str) -> str:
-        """Convert speech to text using OpenAI Whisper"""
-        try:
-            with open(audio_path, "rb") as audio_file:
-                transcript = openai.audio.transcriptions.create(
-                    model="whisper-1",
-                    file=audio_file
+    @property
+    def twilio_client(self) -> "Client":
+        """Twilio client, created on first use"""
+        with self._twilio_lock:
+            if self._twilio_client is None:
+                from twilio.rest import Client
+                
+                # A single client reuses its default keep-alive session, whose
+                # 10-connection pool covers the worker pool and reminder thread
+                self._twilio_client = Client(
+                    os.getenv("TWILIO_ACCOUNT_SID"),
+                    os.getenv("TWILIO_AUTH_TOKEN")
                 )
-            return transcript.text.strip()
+            return self._twilio_client
+    
+    def _wait_for_reminder(self, timeout: float) -> None:
+        """Sleep until the next reminder is due or a new one is scheduled"""
+        self._reminder_wakeup.wait(timeout)
+        self._reminder_wakeup.clear()
+    
+    def _run_reminders(self) -> None:
+        """Fire reminders as they come due, idling while none are scheduled"""
+        while True:
+            self._reminders.run()
+            self._reminder_wakeup.wait()
+            self._reminder_wakeup.clear()
+    
+    def wait_for_reminders(self) -> None:
+        """Block while the reminder thread runs"""
+        self._reminder_thread.join()
+    
+    def close(self) -> None:
+        """Close the task file handle and wait for background work"""
+        self._pool.shutdown(wait=True)
+        self._csv_file.close()
+    
+    def speech_to_text(self, audio: np.ndarray, sample_rate: int) -> str:
+        """Convert recorded float32 audio to text using local faster-whisper model"""
+        try:
+            self.wait_for_asr()
+            if sample_rate != 16000:
+                raise ValueError(f"Whisper expects 16 kHz audio, got {sample_rate} Hz")
+            audio = audio.reshape(-1)
+            if audio.dtype == np.int16:
+                audio = audio.astype(np.float32) * np.float32(1.0 / 32768.0)
+            return self._asr.submit(audio).result()
         except Exception as e:
             logger.error(f"Error in speech_to_text: {e}")
             raise
     
-    def get_voice_input(self, prompt: Optional[str] = None) -> str:
-        """Get user input through voice"""
+    def listen(self) -> str:
+        """Stream microphone audio and transcribe it until the speaker pauses
+        
+        Each chunk is run through the Silero VAD; whenever the detected speech
+        grows, the speech so far is re-transcribed so a hypothesis is ready by
+        the time the trailing silence ends the utterance. Audio captured while
+        a transcription runs arrives as one chunk, so the next pass always
+        works on the newest audio rather than a backlog.
+        """
+        from faster_whisper.vad import get_speech_timestamps
+        
+        self.wait_for_asr()
+        sample_rate = self.config.sample_rate
+        end_silence = self.config.end_silence_ms * sample_rate // 1000
+        no_speech_limit = self.config.no_speech_timeout * sample_rate
+        max_samples = self.config.max_utterance_duration * sample_rate
+        
+        audio = np.empty(0, dtype=np.float32)
+        hypothesis, hypothesis_end = "", 0
+        stream = self.audio_manager.stream_audio()
+        try:
+            for chunk in stream:
+                # Chunks may be ring-buffer views; copy them out before the ring wraps
+                audio = np.concatenate((audio, chunk))
+                speech = get_speech_timestamps(
+                    audio,
+                    vad_options=self._vad_options,
+                    sampling_rate=sample_rate
+                )
+                
+                if not speech:
+                    if len(audio) >= no_speech_limit:
+                        return ""
+                    continue
+                
+                speech_end = speech[-1]["end"]
+                if speech_end != hypothesis_end:
+                    hypothesis = self.speech_to_text(audio[:speech_end], sample_rate)
+                    hypothesis_end = speech_end
+                    logger.info(f"Partial transcript: {hypothesis}")
+                
+                if len(audio) - speech_end >= end_silence or len(audio) >= max_samples:
+                    return hypothesis
+        finally:
+            stream.close()
+        return hypothesis
+    
+    def get_voice_input(self, prompt: Optional[str] = None, next_prompt: Optional[str] = None) -> str:
+        """Get user input through voice
+        
+        next_prompt, when given, is synthesized while the user is answering.
+        """
         if prompt:
             self.audio_manager.text_to_speech(prompt)
         
+        if next_prompt:
+            self.audio_manager.prefetch_speech(next_prompt)
+        
         for attempt in range(self.config.max_retries):
-            audio_path = None
             try:
-                audio = self.audio_manager.record_audio()
-                audio_path = self.audio_manager.save_audio(audio)
-                text = self.speech_to_text(audio_path)
+                text = self.listen()
                 
                 if text:
                     return text
                 
-                self.audio_manager.text_to_speech("Sorry, I didn't catch that. Please try again.")
+                self.audio_manager.text_to_speech(RETRY_PROMPT)
             except Exception as e:
                 logger.error(f"Error in voice input attempt {attempt + 1}: {e}")
-            finally:
-                # Clean up temporary audio file
-                if audio_path and os.path.exists(audio_path):
-                    try:
-                        os.remove(audio_path)
-                    except Exception as e:
-                        logger.warning(f"Failed to remove temporary file {audio_path}: {e}")
                 
         raise ValueError("Maximum retries reached")
 
     def create_task(self) -> Optional[Task]:
         """Voice-guided task creation flow"""
         try:
-            task_name = self.get_voice_input("Please say the task name:")
-            date_str = self.get_voice_input("When is this due? For example, you can say 'tomorrow at 3pm'")
+            task_name = self.get_voice_input(TASK_NAME_PROMPT, next_prompt=DUE_DATE_PROMPT)
+            date_str = self.get_voice_input(DUE_DATE_PROMPT)
             due_date, deadline_time = self.parse_datetime(date_str)
             return Task(task_name, due_date, deadline_time)
         except Exception as e:
@@ -204,9 +666,18 @@ class TaskManager:
             self.audio_manager.text_to_speech(f"Error creating task: {str(e)}")
             return None
 
+    def _parse_date(self, text: str) -> Optional[datetime]:
+        """Parse a date phrase with the shared English-only parser"""
+        if self._date_parser is None:
+            import dateparser
+            
+            # Pinning English skips dateparser's per-call language detection
+            self._date_parser = dateparser.DateDataParser(languages=['en'])
+        return self._date_parser.get_date_data(text).date_obj
+    
     def parse_datetime(self, text: str) -> Tuple[str, str]:
         """Parse natural language datetime"""
-        dt = dateparser.parse(text)
+        dt = self._parse_date(text)
         if not dt:
             raise ValueError("Could not parse datetime")
         
@@ -219,9 +690,10 @@ class TaskManager:
     def save_task(self, task: Task) -> None:
         """Save task to CSV file"""
         try:
-            with open(self.config.csv_file, 'a', newline='', encoding='utf-8') as f:
-                writer = csv.writer(f)
-                writer.writerow([task.name, task.due_date, task.deadline_time])
+            self._csv_row.seek(0)
+            self._csv_row.truncate()
+            self._csv_writer.writerow([task.name, task.due_date, task.deadline_time])
+            self._csv_file.write(self._csv_row.getvalue().encode('utf-8'))
         except Exception as e:
             logger.error(f"Error saving task: {e}")
             raise
@@ -239,15 +711,38 @@ class TaskManager:
             logger.error(f"Error sending WhatsApp message: {e}")
             raise
 
+    @staticmethod
+    def _next_occurrence(deadline_time: str) -> float:
+        """Return the epoch time of the next HH:MM occurrence"""
+        hour, minute = map(int, deadline_time.split(':'))
+        now = datetime.now()
+        fire_at = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+        if fire_at <= now:
+            fire_at += timedelta(days=1)
+        return fire_at.timestamp()
+
     def schedule_reminder(self, task: Task) -> None:
-        """Schedule a reminder for a task"""
+        """Schedule a daily reminder for a task"""
         def send_reminder():
             message = f"Reminder: Task '{task.name}' is due on {task.due_date} at {task.deadline_time}"
-            self.send_whatsapp_message(message)
+            try:
+                self.send_whatsapp_message(message)
+            except Exception:
+                logger.warning(f"Reminder for task '{task.name}' was not delivered")
+            finally:
+                self._reminders.enterabs(self._next_occurrence(task.deadline_time), 1, send_reminder)
         
-        schedule.every().day.at(task.deadline_time).do(send_reminder)
+        self._reminders.enterabs(self._next_occurrence(task.deadline_time), 1, send_reminder)
+        self._reminder_wakeup.set()
         logger.info(f"Reminder scheduled for task '{task.name}' at {task.deadline_time}")
 
+    def notify_task(self, task: Task) -> List[Future]:
+        """Schedule the reminder and send the confirmation in the background"""
+        return [
+            self._pool.submit(self.send_confirmation, task),
+            self._pool.submit(self.schedule_reminder, task)
+        ]
+
     def send_confirmation(self, task: Task) -> None:
         """Send immediate confirmation for task creation"""
         message = f"Task Created: '{task.name}' has been scheduled. It is due on {task.due_date} at {task.deadline_time}"
@@ -255,42 +750,40 @@ class TaskManager:
 
 def main():
     """Main application entry point"""
+    task_manager = None
     try:
         config = TaskConfig()
         audio_manager = AudioManager(config)
         task_manager = TaskManager(config, audio_manager)
         
-        task_manager.audio_manager.text_to_speech(
-            "Welcome to your voice-activated task scheduler. Say 'schedule a task' to begin, or 'exit' to quit."
-        )
+        task_manager.audio_manager.prefetch_speech(COMMAND_PROMPT)
+        task_manager.audio_manager.text_to_speech(WELCOME_PROMPT)
+        task_manager.wait_for_asr()
         
         while True:
             try:
-                command = task_manager.get_voice_input("What would you like to do?")
+                command = task_manager.get_voice_input(
+                    COMMAND_PROMPT, next_prompt=TASK_NAME_PROMPT
+                )
                 
                 if "schedule" in command.lower() or "task" in command.lower():
                     task = task_manager.create_task()
                     if task:
                         task_manager.save_task(task)
-                        task_manager.schedule_reminder(task)
-                        task_manager.send_confirmation(task)
+                        pending = task_manager.notify_task(task)
                         task_manager.audio_manager.text_to_speech(
                             f"Task '{task.name}' scheduled successfully!"
                         )
+                        for future in pending:
+                            future.result()
                 elif "exit" in command.lower():
-                    task_manager.audio_manager.text_to_speech(
-                        "Exiting the task scheduler. Goodbye!"
-                    )
+                    task_manager.audio_manager.text_to_speech(GOODBYE_PROMPT)
                     break
                 else:
-                    task_manager.audio_manager.text_to_speech(
-                        "I didn't understand that command. Please try again."
-                    )
+                    task_manager.audio_manager.text_to_speech(UNKNOWN_COMMAND_PROMPT)
             
             except KeyboardInterrupt:
-                task_manager.audio_manager.text_to_speech(
-                    "Interrupted by user. Exiting the task scheduler."
-                )
+                task_manager.audio_manager.text_to_speech(INTERRUPTED_PROMPT)
                 break
             except Exception as e:
                 logger.error(f"Error in main loop: {e}")
@@ -300,24 +793,31 @@ def main():
         
         logger.info("Scheduler running in background. Press Ctrl+C to quit.")
         try:
-            while True:
-                schedule.run_pending()
-                time.sleep(1)
+            task_manager.wait_for_reminders()
         except KeyboardInterrupt:
             logger.info("Scheduler stopped.")
     
     finally:
-        # Clean up temporary directory
-        try:
-            if os.path.exists(config.temp_dir):
-                for file in os.listdir(config.temp_dir):
-                    try:
-                        os.remove(os.path.join(config.temp_dir, file))
-                    except Exception as e:
-                        logger.warning(f"Failed to remove temporary file {file}: {e}")
-                os.rmdir(config.temp_dir)
-        except Exception as e:
-            logger.warning(f"Failed to clean up temporary directory: {e}")
+        if task_manager is not None:
+            task_manager.close()
+
+def generate_prompt_assets(config: TaskConfig) -> None:
+    """Synthesize every fixed prompt into the prompt assets directory"""
+    load_dotenv()
+    os.makedirs(config.prompt_assets_dir, exist_ok=True)
+    for text in FIXED_PROMPTS:
+        path = os.path.join(config.prompt_assets_dir, f"{prompt_key(text)}.npy")
+        np.save(path, AudioManager._request_speech(text))
+        logger.info(f"Generated prompt audio {path}")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Voice-activated task scheduler")
+    parser.add_argument(
+        "--generate-prompts",
+        action="store_true",
+        help="synthesize the fixed voice prompts into assets/prompts and exit"
+    )
+    if parser.parse_args().generate_prompts:
+        generate_prompt_assets(TaskConfig())
+    else:
+        main()
\ No newline at end of file